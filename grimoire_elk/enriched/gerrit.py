@@ -171,11 +171,11 @@ class GerritEnrich(Enrich):
         """Convert dates so ES detect them"""
 
         for date_field in ['timestamp', 'createdOn', 'lastUpdated']:
-            if date_field in item.keys():
+            if date_field in item:
                 date_ts = item[date_field]
                 item[date_field] = unixtime_to_datetime(date_ts).isoformat()
 
-        if 'patchSets' in item.keys():
+        if 'patchSets' in item:
             for patch in item['patchSets']:
                 pdate_ts = patch['createdOn']
                 patch['createdOn'] = unixtime_to_datetime(pdate_ts).isoformat()
@@ -185,7 +185,7 @@ class GerritEnrich(Enrich):
                         adate_ts = approval['grantedOn']
                         approval['grantedOn'] = unixtime_to_datetime(adate_ts).isoformat()
 
-        if 'comments' in item.keys():
+        if 'comments' in item:
             for comment in item['comments']:
                 cdate_ts = comment['timestamp']
                 comment['timestamp'] = unixtime_to_datetime(cdate_ts).isoformat()